@@ -5,11 +5,12 @@ import json
 import time
 import logging
 from datetime import datetime
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, render_template, jsonify, request, g
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit
 import psutil
 import threading
+from log_pipeline import setup_logging, get_stats as get_log_stats, new_job_id, new_request_id, clean_request_id
 
 try:
     import GPUtil
@@ -30,14 +31,9 @@ app.config['SECRET_KEY'] = 'gpu-demo-secret-key-2024'
 CORS(app)
 socketio = SocketIO(app, cors_allowed_origins="*")
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/opt/gpu-demo/logs/app.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Log records are queued and written by a background thread so request
+# handlers and socket greenlets never block on disk or stdout
+setup_logging('/opt/gpu-demo/logs/app.log', level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize GPU demos if available
@@ -47,7 +43,7 @@ if gpu_demos_available:
         gpu_demos = GPUDemos()
         logger.info("GPU demos initialized successfully")
     except Exception as e:
-        logger.error(f"Failed to initialize GPU demos: {e}")
+        logger.error("Failed to initialize GPU demos: %s", e)
         gpu_demos_available = False
 
 def get_system_info():
@@ -105,7 +101,7 @@ def get_system_info():
                     })
                 system_info['gpu'] = gpu_info
             except Exception as e:
-                logger.warning(f"Error getting GPU info: {e}")
+                logger.warning("Error getting GPU info: %s", e)
                 system_info['gpu'] = []
         else:
             system_info['gpu'] = []
@@ -113,7 +109,7 @@ def get_system_info():
         return system_info
         
     except Exception as e:
-        logger.error(f"Error getting system info: {e}")
+        logger.error("Error getting system info: %s", e)
         return {'error': str(e), 'timestamp': datetime.now().isoformat()}
 
 def emit_system_stats():
@@ -124,7 +120,7 @@ def emit_system_stats():
             socketio.emit('system_stats', stats)
             time.sleep(2)
         except Exception as e:
-            logger.error(f"Error emitting system stats: {e}")
+            logger.error("Error emitting system stats: %s", e)
             time.sleep(5)
 
 # Start background thread for system stats
@@ -132,6 +128,11 @@ stats_thread = threading.Thread(target=emit_system_stats)
 stats_thread.daemon = True
 stats_thread.start()
 
+@app.before_request
+def assign_request_id():
+    """Tag each HTTP request with an ID for log correlation"""
+    g.request_id = clean_request_id(request.headers.get('X-Request-ID')) or new_request_id()
+
 @app.route('/')
 def index():
     """Main dashboard page"""
@@ -146,7 +147,8 @@ def health_check():
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
         'gpu_available': gpu_available,
-        'gpu_demos_available': gpu_demos_available
+        'gpu_demos_available': gpu_demos_available,
+        'logging': get_log_stats()
     })
 
 @app.route('/api/system-info')
@@ -164,6 +166,7 @@ def gpu_benchmark():
         data = request.get_json()
         benchmark_type = data.get('type', 'matrix_multiply')
         size = data.get('size', 1024)
+        g.job_id = new_job_id()
         
         if benchmark_type == 'matrix_multiply':
             result = gpu_demos.matrix_multiplication_benchmark(size)
@@ -177,7 +180,7 @@ def gpu_benchmark():
         return jsonify(result)
         
     except Exception as e:
-        logger.error(f"GPU benchmark error: {e}")
+        logger.error("GPU benchmark error: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/cpu-benchmark', methods=['POST'])
@@ -190,6 +193,7 @@ def cpu_benchmark():
         data = request.get_json()
         benchmark_type = data.get('type', 'matrix_multiply')
         size = data.get('size', 1024)
+        g.job_id = new_job_id()
         
         if benchmark_type == 'matrix_multiply':
             result = gpu_demos.cpu_matrix_multiplication_benchmark(size)
@@ -199,7 +203,7 @@ def cpu_benchmark():
         return jsonify(result)
         
     except Exception as e:
-        logger.error(f"CPU benchmark error: {e}")
+        logger.error("CPU benchmark error: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/gpu-info')
@@ -224,7 +228,7 @@ def gpu_info():
             })
         return jsonify({'gpus': gpu_list})
     except Exception as e:
-        logger.error(f"Error getting GPU info: {e}")
+        logger.error("Error getting GPU info: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @socketio.on('connect')
@@ -244,6 +248,7 @@ def handle_benchmark_request(data):
     try:
         benchmark_type = data.get('type', 'matrix_multiply')
         size = data.get('size', 1024)
+        g.job_id = new_job_id()
         
         if gpu_demos_available:
             if benchmark_type == 'matrix_multiply':
@@ -262,13 +267,13 @@ def handle_benchmark_request(data):
             emit('benchmark_error', {'error': 'GPU demos not available'})
             
     except Exception as e:
-        logger.error(f"WebSocket benchmark error: {e}")
+        logger.error("WebSocket benchmark error: %s", e)
         emit('benchmark_error', {'error': str(e)})
 
 if __name__ == '__main__':
     logger.info("Starting GPU Demo Application...")
-    logger.info(f"GPU Available: {gpu_available}")
-    logger.info(f"GPU Demos Available: {gpu_demos_available}")
+    logger.info("GPU Available: %s", gpu_available)
+    logger.info("GPU Demos Available: %s", gpu_demos_available)
     
     # Run with socketio for WebSocket support
     socketio.run(app, 
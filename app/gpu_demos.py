@@ -16,7 +16,7 @@ try:
     logger.info("CUML and CuPy available")
 except ImportError as e:
     CUML_AVAILABLE = False
-    logger.warning(f"CUML/CuPy not available: {e}")
+    logger.warning("CUML/CuPy not available: %s", e)
     cp = None
 
 try:
@@ -42,7 +42,7 @@ class GPUDemos:
             return {'error': 'CuPy not available', 'time': 0, 'gflops': 0}
         
         try:
-            logger.info(f"Running GPU matrix multiplication benchmark (size: {size}x{size})")
+            logger.info("Running GPU matrix multiplication benchmark (size: %sx%s)", size, size)
             
             # Create random matrices on GPU
             start_time = time.time()
@@ -80,17 +80,17 @@ class GPUDemos:
                 'timestamp': datetime.now().isoformat()
             }
             
-            logger.info(f"GPU benchmark completed: {gflops:.2f} GFLOPS in {compute_time:.4f}s")
+            logger.info("GPU benchmark completed: %.2f GFLOPS in %.4fs", gflops, compute_time)
             return result
             
         except Exception as e:
-            logger.error(f"GPU matrix multiplication error: {e}")
+            logger.error("GPU matrix multiplication error: %s", e)
             return {'error': str(e), 'time': 0, 'gflops': 0}
     
     def cpu_matrix_multiplication_benchmark(self, size=1024):
         """CPU matrix multiplication benchmark for comparison"""
         try:
-            logger.info(f"Running CPU matrix multiplication benchmark (size: {size}x{size})")
+            logger.info("Running CPU matrix multiplication benchmark (size: %sx%s)", size, size)
             
             # Create random matrices on CPU
             start_time = time.time()
@@ -117,11 +117,11 @@ class GPUDemos:
                 'timestamp': datetime.now().isoformat()
             }
             
-            logger.info(f"CPU benchmark completed: {gflops:.2f} GFLOPS in {compute_time:.4f}s")
+            logger.info("CPU benchmark completed: %.2f GFLOPS in %.4fs", gflops, compute_time)
             return result
             
         except Exception as e:
-            logger.error(f"CPU matrix multiplication error: {e}")
+            logger.error("CPU matrix multiplication error: %s", e)
             return {'error': str(e), 'time': 0, 'gflops': 0}
     
     def ml_inference_benchmark(self):
@@ -179,11 +179,14 @@ class GPUDemos:
                 'timestamp': datetime.now().isoformat()
             }
             
-            logger.info(f"ML benchmark completed: {speedup:.2f}x speedup" if speedup else "ML benchmark completed")
+            if speedup:
+                logger.info("ML benchmark completed: %.2fx speedup", speedup)
+            else:
+                logger.info("ML benchmark completed")
             return result
             
         except Exception as e:
-            logger.error(f"ML inference error: {e}")
+            logger.error("ML inference error: %s", e)
             return {'error': str(e)}
     
     def linear_regression_benchmark(self):
@@ -258,11 +261,14 @@ class GPUDemos:
                 'timestamp': datetime.now().isoformat()
             }
             
-            logger.info(f"Linear regression completed: R² = {r2_score:.4f}, {speedup:.2f}x speedup" if speedup else f"Linear regression completed: R² = {r2_score:.4f}")
+            if speedup:
+                logger.info("Linear regression completed: R² = %.4f, %.2fx speedup", r2_score, speedup)
+            else:
+                logger.info("Linear regression completed: R² = %.4f", r2_score)
             return result
             
         except Exception as e:
-            logger.error(f"Linear regression error: {e}")
+            logger.error("Linear regression error: %s", e)
             return {'error': str(e)}
     
     def image_processing_benchmark(self):
@@ -350,11 +356,14 @@ class GPUDemos:
                 'timestamp': datetime.now().isoformat()
             }
             
-            logger.info(f"Image processing completed: {speedup:.2f}x speedup" if speedup else "Image processing completed")
+            if speedup:
+                logger.info("Image processing completed: %.2fx speedup", speedup)
+            else:
+                logger.info("Image processing completed")
             return result
             
         except Exception as e:
-            logger.error(f"Image processing error: {e}")
+            logger.error("Image processing error: %s", e)
             return {'error': str(e)}
     
     def get_gpu_status(self):
@@ -379,5 +388,5 @@ class GPUDemos:
             return status
             
         except Exception as e:
-            logger.error(f"GPU status error: {e}")
+            logger.error("GPU status error: %s", e)
             return {'error': str(e)}
\ No newline at end of file
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Non-blocking logging pipeline for the GPU demo application.
+
+Log calls made from request handlers and WebSocket greenlets only enqueue the
+record into a bounded buffer. A single background writer thread drains the
+buffer, renders JSON lines and writes them in batches to the log file and to
+stdout. When the buffer is full, records are dropped and counted
+instead of stalling the caller.
+"""
+import os
+import re
+import sys
+import json
+import time
+import atexit
+import logging
+from datetime import datetime, timezone
+
+try:
+    # Under gunicorn's eventlet worker, threading and queue are monkey-patched
+    # into green versions, which would put the writer back on the event loop.
+    # Use the original OS-thread implementations so file I/O stays off it.
+    from eventlet import patcher as _eventlet_patcher
+    _threading = _eventlet_patcher.original('threading')
+    _queue = _eventlet_patcher.original('queue')
+except ImportError:
+    import threading as _threading
+    import queue as _queue
+
+try:
+    from flask import has_request_context, request, g
+except ImportError:
+    has_request_context = None
+
+# Client-supplied request IDs are only trusted in this shape
+_REQUEST_ID_RE = re.compile(r'[A-Za-z0-9._-]{1,64}')
+
+# Attributes present on every LogRecord; anything else was passed via extra=
+_RESERVED_ATTRS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {
+    'message', 'asctime', 'request_id', 'job_id'
+}
+
+
+class ContextFilter(logging.Filter):
+    """Attach request and job IDs to records while still on the calling greenlet"""
+
+    def filter(self, record):
+        if not hasattr(record, 'request_id'):
+            record.request_id = None
+            if has_request_context is not None and has_request_context():
+                record.request_id = (
+                    getattr(g, 'request_id', None)
+                    or getattr(request, 'sid', None)
+                    or clean_request_id(request.headers.get('X-Request-ID'))
+                )
+        if not hasattr(record, 'job_id'):
+            record.job_id = None
+            if has_request_context is not None and has_request_context():
+                record.job_id = getattr(g, 'job_id', None)
+        return True
+
+
+class JSONFormatter(logging.Formatter):
+    """Render a record as a single JSON line"""
+
+    def format(self, record):
+        entry = {
+            'timestamp': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'process': record.process,
+        }
+        if getattr(record, 'request_id', None):
+            entry['request_id'] = record.request_id
+        if getattr(record, 'job_id', None):
+            entry['job_id'] = record.job_id
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class LogWriter:
+    """Background thread that drains the log buffer in batches"""
+
+    def __init__(self, log_queue, path=None, stream=None, batch_size=256, flush_interval=0.5):
+        self.queue = log_queue
+        self.path = path
+        self.stream = stream
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.formatter = JSONFormatter()
+        self.dropped = 0
+        self.written = 0
+        self.write_errors = 0
+        self._reported_dropped = 0
+        self._file = None
+        self._file_id = None
+        self._stop = _threading.Event()
+        self._thread = _threading.Thread(target=self._run, name='log-writer', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self, timeout=2.0):
+        """Stop the writer after flushing whatever is still buffered"""
+        self._stop.set()
+        self._thread.join(timeout)
+
+    def stats(self):
+        return {
+            'buffered': self.queue.qsize(),
+            'capacity': self.queue.maxsize,
+            'written': self.written,
+            'dropped': self.dropped,
+            'write_errors': self.write_errors,
+        }
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                batch = [self.queue.get(timeout=self.flush_interval)]
+            except _queue.Empty:
+                continue
+            self._drain_into(batch, max_items=self.batch_size)
+            self._write_batch(batch)
+        # Final flush on shutdown
+        batch = []
+        self._drain_into(batch)
+        if batch:
+            self._write_batch(batch)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _drain_into(self, batch, max_items=None):
+        """Move queued records into batch until it holds max_items (None: no cap)"""
+        while max_items is None or len(batch) < max_items:
+            try:
+                batch.append(self.queue.get_nowait())
+            except _queue.Empty:
+                break
+
+    def _write_batch(self, records):
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.formatter.format(record))
+            except Exception:
+                # Never let one bad record take down the writer
+                lines.append(json.dumps({
+                    'level': 'ERROR',
+                    'logger': __name__,
+                    'message': 'Failed to format log record from %s' % record.name,
+                }))
+
+        dropped = self.dropped
+        if dropped > self._reported_dropped:
+            lines.append(json.dumps({
+                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'level': 'WARNING',
+                'logger': __name__,
+                'message': 'Log buffer full, records dropped',
+                'dropped': dropped - self._reported_dropped,
+                'dropped_total': dropped,
+            }))
+            self._reported_dropped = dropped
+
+        data = '\n'.join(lines) + '\n'
+        # A batch counts as written once it reaches the log file, or stdout
+        # when no file is configured
+        written = False
+        if self.path:
+            try:
+                self._write_file(data)
+                written = True
+            except OSError as e:
+                self.write_errors += 1
+                if self._file is not None:
+                    try:
+                        self._file.close()
+                    except OSError:
+                        pass
+                    self._file = None
+                sys.stderr.write('log writer: cannot write %s: %s\n' % (self.path, e))
+        if self.stream is not None:
+            try:
+                self.stream.write(data)
+                self.stream.flush()
+                written = written or not self.path
+            except (OSError, ValueError):
+                if not self.path:
+                    self.write_errors += 1
+        if written:
+            self.written += len(records)
+
+    def _write_file(self, data):
+        # Every gunicorn worker appends to the same file, so rotation is left
+        # to logrotate. Reopen when the path no longer points at our handle,
+        # the same way logging.handlers.WatchedFileHandler does.
+        try:
+            st = os.stat(self.path)
+            current_id = (st.st_dev, st.st_ino)
+        except FileNotFoundError:
+            current_id = None
+        if self._file is not None and current_id != self._file_id:
+            self._file.close()
+            self._file = None
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+            st = os.fstat(self._file.fileno())
+            self._file_id = (st.st_dev, st.st_ino)
+        self._file.write(data)
+        self._file.flush()
+
+
+class BufferedQueueHandler(logging.Handler):
+    """Handler that enqueues records without blocking and counts drops"""
+
+    def __init__(self, writer):
+        super().__init__()
+        self.writer = writer
+        self.addFilter(ContextFilter())
+
+    def emit(self, record):
+        try:
+            if record.exc_info:
+                # Render the traceback now, before the frames go away
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+                record.exc_info = None
+            # Merge args here, as QueueHandler.prepare does: they may be
+            # mutated later or be context-bound proxies the writer can't read
+            record.msg = record.getMessage()
+            record.args = None
+            self.writer.queue.put_nowait(record)
+        except _queue.Full:
+            self.writer.dropped += 1
+        except Exception:
+            self.handleError(record)
+
+
+_writer = None
+
+
+def setup_logging(log_file='/opt/gpu-demo/logs/app.log', level=logging.INFO,
+                  buffer_size=10000, stream=sys.stdout):
+    """Install the queue-backed handler on the root logger and start the writer"""
+    global _writer
+    if _writer is not None:
+        return _writer
+
+    log_dir = os.path.dirname(log_file)
+    if log_dir and not os.path.isdir(log_dir):
+        try:
+            os.makedirs(log_dir, exist_ok=True)
+        except OSError:
+            log_file = None
+
+    _writer = LogWriter(
+        _queue.Queue(maxsize=buffer_size),
+        path=log_file,
+        stream=stream,
+    )
+    _writer.start()
+    atexit.register(_writer.stop)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(BufferedQueueHandler(_writer))
+    root.setLevel(level)
+    return _writer
+
+
+def get_stats():
+    """Return buffer and drop counters for the active writer"""
+    if _writer is None:
+        return None
+    return _writer.stats()
+
+
+def _new_id():
+    return '%x-%x' % (int(time.time() * 1000), int.from_bytes(os.urandom(4), 'big'))
+
+
+def new_request_id():
+    """Short identifier used to correlate log lines for a single HTTP request"""
+    return _new_id()
+
+
+def new_job_id():
+    """Short identifier used to correlate log lines for a single benchmark run"""
+    return _new_id()
+
+
+def clean_request_id(value):
+    """Return a client-supplied request ID if it is safe to log, else None"""
+    if value and _REQUEST_ID_RE.fullmatch(value):
+        return value
+    return None
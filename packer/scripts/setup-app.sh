@@ -45,6 +45,29 @@ EOF
 sudo mkdir -p /opt/gpu-demo/logs
 sudo chown ubuntu:ubuntu /opt/gpu-demo/logs
 
+# Rotate the application log. Both gunicorn workers append to app.log and
+# reopen it when the inode changes, so logrotate moves the file and creates
+# a fresh one instead of the app rotating it in-process.
+sudo tee /etc/logrotate.d/gpu-demo << 'EOF'
+/opt/gpu-demo/logs/app.log {
+    su ubuntu ubuntu
+    size 10M
+    rotate 5
+    missingok
+    notifempty
+    compress
+    delaycompress
+    create 0644 ubuntu ubuntu
+}
+EOF
+
+# logrotate only runs daily by default; check the size limit hourly
+sudo tee /etc/cron.hourly/gpu-demo-logrotate << 'EOF'
+#!/bin/sh
+/usr/sbin/logrotate /etc/logrotate.d/gpu-demo
+EOF
+sudo chmod +x /etc/cron.hourly/gpu-demo-logrotate
+
 # Create startup script that ensures CUDA is available
 sudo tee /opt/gpu-demo/start.sh << 'EOF'
 #!/bin/bash